@@ -14,19 +14,90 @@ from datetime import datetime
 import tempfile
 import os
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import functools
+import itertools
+import multiprocessing
+import queue
+import threading
+import time
 
 try:
     from minio import Minio
     from minio.error import S3Error
+    import certifi
+    import urllib3
+    from urllib3.util.retry import Retry
     MINIO_AVAILABLE = True
 except ImportError:
     MINIO_AVAILABLE = False
     print("Warning: minio library not installed. Install with: pip install minio")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_default(obj):
+    """Serialize values the stdlib json module does not handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(obj, indent=False):
+    """Serialize to a JSON string, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default)
+
+def _loads(data):
+    """Parse a JSON string or bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Get the directory where this node file is located
 NODE_DIR = Path(__file__).parent
 CONFIG_FILE = NODE_DIR / "s3_config.json"
 
+# Parsed config cache, invalidated when the config file's mtime changes
+_CONFIG_CACHE = {"mtime": None, "data": None, "profile_names": None}
+
+# (endpoint, bucket) -> monotonic time it was confirmed to exist, so saves skip the HEAD
+# request; network checks are serialized per bucket, never under the global lock
+_KNOWN_BUCKETS = {}
+_BUCKET_LOCKS = {}
+_KNOWN_BUCKETS_LOCK = threading.Lock()
+
+# Maximum number of images encoded/uploaded concurrently per batch
+MAX_UPLOAD_WORKERS = 16
+
+# Maximum worker processes for opt-in out-of-process PNG encoding
+MAX_ENCODE_PROCESSES = 8
+
+# Objects larger than one part are sent as a parallel multipart upload
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_PARALLEL_UPLOADS = 4
+
+# Listings larger than one S3 page are split by sub-prefix and fetched concurrently
+LIST_PAGE_SIZE = 1000
+MAX_LIST_WORKERS = 16
+
+# Objects above the threshold are downloaded as concurrent byte-range GETs
+RANGED_GET_THRESHOLD = 16 * 1024 * 1024
+RANGED_GET_CHUNK_SIZE = 8 * 1024 * 1024
+MAX_DOWNLOAD_WORKERS = 8
+
+# Connections kept per host: enough for every upload worker to run a full multipart upload
+HTTP_POOL_MAXSIZE = max(
+    MAX_UPLOAD_WORKERS * MULTIPART_PARALLEL_UPLOADS, MAX_LIST_WORKERS, MAX_DOWNLOAD_WORKERS
+)
+
 class S3ConfigManager:
     """Manages S3 configuration from JSON file"""
     
@@ -42,12 +113,27 @@ class S3ConfigManager:
             S3ConfigManager.create_default_config()
         
         try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            mtime = CONFIG_FILE.stat().st_mtime_ns
+            if _CONFIG_CACHE["mtime"] == mtime and _CONFIG_CACHE["data"] is not None:
+                return _CONFIG_CACHE["data"]
+            
+            with open(CONFIG_FILE, 'rb') as f:
+                config = _loads(f.read())
+            
+            _CONFIG_CACHE["mtime"] = mtime
+            _CONFIG_CACHE["data"] = config
+            _CONFIG_CACHE["profile_names"] = None
             return config
         except Exception as e:
             raise ValueError(f"Failed to load S3 config from {CONFIG_FILE}: {str(e)}")
     
+    @staticmethod
+    def clear_cache():
+        """Drop the cached parsed config so the next load re-reads the file"""
+        _CONFIG_CACHE["mtime"] = None
+        _CONFIG_CACHE["data"] = None
+        _CONFIG_CACHE["profile_names"] = None
+    
     @staticmethod
     def create_default_config():
         """Create default configuration file"""
@@ -92,6 +178,7 @@ class S3ConfigManager:
         try:
             with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
                 json.dump(default_config, f, indent=4)
+            S3ConfigManager.clear_cache()
             print(f"✅ Created default S3 config at: {CONFIG_FILE}")
             print("📝 Please edit this file with your S3 credentials!")
         except Exception as e:
@@ -102,7 +189,9 @@ class S3ConfigManager:
         """Get list of available profile names"""
         try:
             config = S3ConfigManager.load_config()
-            return list(config.get("profiles", {}).keys())
+            if _CONFIG_CACHE["profile_names"] is None:
+                _CONFIG_CACHE["profile_names"] = list(config.get("profiles", {}).keys())
+            return list(_CONFIG_CACHE["profile_names"])
         except:
             return ["default"]
     
@@ -128,6 +217,9 @@ class S3ConfigManager:
 class S3Client:
     """S3 Client wrapper using minio"""
     
+    # Clients keyed by connection settings so pooled connections are reused across calls
+    _CLIENT_CACHE = {}
+    
     @staticmethod
     def create_from_profile(profile_name):
         """Create S3 client from profile configuration"""
@@ -146,20 +238,148 @@ class S3Client:
             secure = False
         else:
             secure = profile.get("secure", True)
-            
-        return Minio(
-            endpoint=endpoint,
-            access_key=profile["access_key"],
-            secret_key=profile["secret_key"],
-            secure=secure
-        ), profile
+        
+        cache_key = (endpoint, profile["access_key"], profile["secret_key"], secure)
+        client = S3Client._CLIENT_CACHE.get(cache_key)
+        if client is None:
+            # Same settings as minio's default client, with a pool sized for parallel transfers
+            timeout = 300
+            http_client = urllib3.PoolManager(
+                timeout=urllib3.Timeout(connect=timeout, read=timeout),
+                maxsize=HTTP_POOL_MAXSIZE,
+                cert_reqs='CERT_REQUIRED',
+                ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+                retries=Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504])
+            )
+            client = Minio(
+                endpoint=endpoint,
+                access_key=profile["access_key"],
+                secret_key=profile["secret_key"],
+                secure=secure,
+                http_client=http_client
+            )
+            S3Client._CLIENT_CACHE[cache_key] = client
+        
+        return client, profile
+
+# Process pool for PNG encoding, created on first use
+_ENCODE_POOL = None
+_ENCODE_POOL_LOCK = threading.Lock()
+
+def _warm_up_worker():
+    """Keep a freshly forked worker busy briefly so every worker gets started"""
+    time.sleep(0.05)
+
+def _get_encode_pool():
+    """Return the shared PNG encode process pool, or None where fork is unavailable"""
+    global _ENCODE_POOL
+    # Workers must inherit this already-imported module; spawn would have to re-import
+    # it by name, which fails for custom nodes loaded from a file path.
+    # Forking a multithreaded process (ComfyUI, with CUDA initialised) can deadlock a
+    # child and warns on Python 3.12+; this is why encode_in_processes is opt-in.
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    with _ENCODE_POOL_LOCK:
+        if _ENCODE_POOL is None:
+            workers = min(MAX_ENCODE_PROCESSES, os.cpu_count() or 1)
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork")
+            )
+            # Fork every worker now, before the batch starts its upload threads,
+            # instead of lazily from submit() while those threads are running
+            for future in [pool.submit(_warm_up_worker) for _ in range(workers)]:
+                future.result()
+            _ENCODE_POOL = pool
+        return _ENCODE_POOL
+
+def _reset_encode_pool(broken_pool):
+    """Discard a broken encode pool so the next use builds a new one"""
+    global _ENCODE_POOL
+    with _ENCODE_POOL_LOCK:
+        if _ENCODE_POOL is broken_pool:
+            _ENCODE_POOL = None
+    broken_pool.shutdown(wait=False)
+
+def _submit_encode(arr, metadata, compress_level):
+    """Submit a PNG encode job, rebuilding the pool once if a worker has died"""
+    pool = _get_encode_pool()
+    try:
+        return pool, pool.submit(_encode_png, arr, metadata, compress_level)
+    except BrokenProcessPool:
+        _reset_encode_pool(pool)
+        pool = _get_encode_pool()
+        return pool, pool.submit(_encode_png, arr, metadata, compress_level)
+
+def _encode_png(arr, metadata, compress_level):
+    """Encode a uint8 image array as PNG bytes (runs in a worker process)"""
+    buffer = io.BytesIO()
+    Image.fromarray(arr).save(buffer, format='PNG', pnginfo=metadata, compress_level=compress_level)
+    return buffer.getvalue()
+
+class _PngUploadStream(io.RawIOBase):
+    """Pipe between a PNG encoder thread (writer) and an S3 upload (reader)"""
+    
+    def __init__(self, max_pending_chunks=16):
+        super().__init__()
+        self._chunks = queue.Queue(maxsize=max_pending_chunks)
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._error = None
+        self._aborted = threading.Event()
+    
+    def readable(self):
+        return True
+    
+    def writable(self):
+        return True
+    
+    def _put(self, item):
+        # Never block forever if the reader has gone away
+        while not self._aborted.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def write(self, data):
+        if not self._put(bytes(data)):
+            raise IOError("S3 upload aborted")
+        return len(data)
+    
+    def finish(self, error=None):
+        """Signal end of stream; a non-None error is raised on the reader side"""
+        self._error = error
+        self._put(None)
+    
+    def abort(self):
+        """Unblock the writer after the reader stops consuming"""
+        self._aborted.set()
+    
+    def read(self, size=-1):
+        # Gather up to size bytes so minio receives whole parts rather than small writes
+        buf = bytearray()
+        while (size is None or size < 0 or len(buf) < size) and not self._eof:
+            if not self._pending:
+                chunk = self._chunks.get()
+                if chunk is None:
+                    self._eof = True
+                    if self._error is not None:
+                        raise IOError(f"PNG encoding failed: {self._error}")
+                    break
+                self._pending = memoryview(chunk)
+            take = len(self._pending) if size is None or size < 0 else min(size - len(buf), len(self._pending))
+            buf += self._pending[:take]
+            self._pending = self._pending[take:]
+        return bytes(buf)
 
 class SaveImageToS3:
     """Save images to any S3-compatible storage using profile from config file"""
     
     def __init__(self):
         self.type = "output"
-        self.compress_level = 4
 
     @classmethod
     def INPUT_TYPES(cls):
@@ -175,6 +395,8 @@ class SaveImageToS3:
             },
             "optional": {
                 "custom_region": ("STRING", {"default": "", "tooltip": "Override region from profile (optional)"}),
+                "compress_level": ("INT", {"default": 1, "min": 0, "max": 9, "tooltip": "PNG compression level (0 = none, 9 = smallest/slowest)"}),
+                "encode_in_processes": ("BOOLEAN", {"default": False, "tooltip": "Encode PNGs in forked worker processes (helps large batches on fast networks; Linux/macOS only). Forking a multithreaded process can occasionally hang a worker"}),
             },
             "hidden": {
                 "prompt": "PROMPT", 
@@ -189,8 +411,107 @@ class SaveImageToS3:
     CATEGORY = "s3_storage"
     DESCRIPTION = "Save images to S3-compatible storage using config profiles"
 
+    def _encode_and_upload(self, client, bucket, object_key, image, metadata, compress_level):
+        """Encode a single image tensor as PNG and upload it to S3"""
+        # Scale, clamp and cast on the tensor's device so only uint8 data is copied to host
+        arr = image.mul(255.0).clamp_(0, 255).to(torch.uint8).cpu().numpy()
+        img = Image.fromarray(arr)
+        
+        # Encode on a separate thread and stream into the upload. With length=-1 minio
+        # reads part_size + 1 bytes before sending anything, so PNGs under one part are
+        # fully buffered with no encode/upload overlap. Larger PNGs overlap deflate with
+        # part uploads, holding up to MULTIPART_PARALLEL_UPLOADS + 1 parts (~40 MB) per
+        # image rather than the whole file
+        stream = _PngUploadStream()
+        
+        def encode():
+            try:
+                img.save(stream, format='PNG', pnginfo=metadata, compress_level=compress_level)
+            except Exception as e:
+                stream.finish(e)
+            else:
+                stream.finish()
+        
+        encoder = threading.Thread(target=encode, daemon=True)
+        encoder.start()
+        try:
+            client.put_object(
+                bucket_name=bucket,
+                object_name=object_key,
+                data=stream,
+                length=-1,
+                content_type='image/png',
+                part_size=MULTIPART_PART_SIZE,
+                num_parallel_uploads=MULTIPART_PARALLEL_UPLOADS
+            )
+        finally:
+            stream.abort()
+            encoder.join()
+
+    @staticmethod
+    def _ensure_bucket(client, endpoint, bucket, region, stale_before=None):
+        """Create the bucket if missing, checking S3 only once per endpoint and bucket
+        
+        A confirmation made before stale_before (a time.monotonic() value) is ignored,
+        which forces a re-check after an upload reported the bucket missing.
+        """
+        bucket_key = (endpoint, bucket)
+        
+        def confirmed():
+            verified_at = _KNOWN_BUCKETS.get(bucket_key)
+            return verified_at is not None and (stale_before is None or verified_at > stale_before)
+        
+        with _KNOWN_BUCKETS_LOCK:
+            if confirmed():
+                return
+            bucket_lock = _BUCKET_LOCKS.setdefault(bucket_key, threading.Lock())
+        
+        with bucket_lock:
+            # Another worker may have confirmed or recreated it while we waited
+            with _KNOWN_BUCKETS_LOCK:
+                if confirmed():
+                    return
+            if not client.bucket_exists(bucket):
+                client.make_bucket(bucket, location=region)
+            with _KNOWN_BUCKETS_LOCK:
+                _KNOWN_BUCKETS[bucket_key] = time.monotonic()
+
+    @staticmethod
+    def _upload_encoded(client, bucket, object_key, encode_job, encode_args):
+        """Upload PNG bytes produced by the encode process pool"""
+        pool, encode_future = encode_job
+        try:
+            data = encode_future.result()
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM kill); rebuild the pool and encode this image again
+            _reset_encode_pool(pool)
+            _, encode_future = _submit_encode(*encode_args)
+            data = encode_future.result()
+        client.put_object(
+            bucket_name=bucket,
+            object_name=object_key,
+            data=io.BytesIO(data),
+            length=len(data),
+            content_type='image/png',
+            part_size=MULTIPART_PART_SIZE,
+            num_parallel_uploads=MULTIPART_PARALLEL_UPLOADS
+        )
+
+    def _upload_with_bucket_retry(self, client, endpoint, bucket, region, upload):
+        """Run an upload, recreating the bucket once if it has disappeared"""
+        started_at = time.monotonic()
+        try:
+            upload()
+        except S3Error as e:
+            if e.code != "NoSuchBucket":
+                raise
+            # Only re-check if nobody confirmed the bucket since this upload began
+            self._ensure_bucket(client, endpoint, bucket, region, stale_before=started_at)
+            upload()
+
     def save_images(self, images, profile, bucket, prefix="comfyui/", 
-                   filename_prefix="image", custom_region="", prompt=None, extra_pnginfo=None):
+                   filename_prefix="image", custom_region="", compress_level=1, encode_in_processes=False,
+                   prompt=None, extra_pnginfo=None):
         """Save images to S3 storage"""
         
         if not bucket:
@@ -200,57 +521,69 @@ class SaveImageToS3:
             client, profile_config = S3Client.create_from_profile(profile)
             region = custom_region or profile_config.get("region", "us-east-1")
             
-            if not client.bucket_exists(bucket):
-                client.make_bucket(bucket, location=region)
+            endpoint = profile_config["endpoint"]
+            self._ensure_bucket(client, endpoint, bucket, region)
+            
+            if endpoint.startswith(('http://', 'https://')):
+                base_url = endpoint
+            else:
+                protocol = "https" if profile_config.get("secure", True) else "http"
+                base_url = f"{protocol}://{endpoint}"
             
             results = []
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
-            for batch_number, image in enumerate(images):
-                i = 255. * image.cpu().numpy()
-                img = Image.fromarray(np.clip(i, 0, 255).astype(np.uint8))
-                
-                metadata = PngInfo()
-                if prompt is not None:
-                    metadata.add_text("prompt", json.dumps(prompt))
-                if extra_pnginfo is not None:
-                    for x in extra_pnginfo:
-                        metadata.add_text(x, json.dumps(extra_pnginfo[x]))
-                
-                filename = f"{filename_prefix}_{timestamp}_{batch_number:04d}.png"
-                object_key = f"{prefix.rstrip('/')}/{filename}"
-                
-                img_buffer = io.BytesIO()
-                img.save(img_buffer, format='PNG', pnginfo=metadata, compress_level=self.compress_level)
-                img_buffer.seek(0)
-                
-                client.put_object(
-                    bucket_name=bucket,
-                    object_name=object_key,
-                    data=img_buffer,
-                    length=len(img_buffer.getvalue()),
-                    content_type='image/png'
-                )
-                
-                endpoint = profile_config["endpoint"]
-                secure = profile_config.get("secure", True)
-                protocol = "https" if secure else "http"
-                if not endpoint.startswith(('http://', 'https://')):
-                    url = f"{protocol}://{endpoint}/{bucket}/{object_key}"
-                else:
-                    url = f"{endpoint}/{bucket}/{object_key}"
+            # Workflow metadata is identical for every image, so build the PNG text
+            # chunks once per batch; PIL only reads them while saving.
+            # Stdlib json keeps the ASCII-escaped tEXt format of ComfyUI's SaveImage
+            metadata = PngInfo()
+            if prompt is not None:
+                metadata.add_text("prompt", json.dumps(prompt))
+            if extra_pnginfo is not None:
+                for x in extra_pnginfo:
+                    metadata.add_text(x, json.dumps(extra_pnginfo[x]))
+            
+            # Getting the pool here starts its workers before any upload threads exist
+            use_encode_pool = encode_in_processes and _get_encode_pool() is not None
+            
+            # Encode and upload each image concurrently; S3 round trips dominate
+            with ThreadPoolExecutor(max_workers=max(1, min(MAX_UPLOAD_WORKERS, len(images)))) as executor:
+                futures = []
+                for batch_number, image in enumerate(images):
+                    filename = f"{filename_prefix}_{timestamp}_{batch_number:04d}.png"
+                    object_key = f"{prefix.rstrip('/')}/{filename}"
+                    if use_encode_pool:
+                        arr = image.mul(255.0).clamp_(0, 255).to(torch.uint8).cpu().numpy()
+                        encode_args = (arr, metadata, compress_level)
+                        upload = functools.partial(
+                            self._upload_encoded, client, bucket, object_key,
+                            _submit_encode(*encode_args), encode_args
+                        )
+                    else:
+                        upload = functools.partial(
+                            self._encode_and_upload, client, bucket, object_key, image, metadata, compress_level
+                        )
+                    future = executor.submit(
+                        self._upload_with_bucket_retry, client, endpoint, bucket, region, upload
+                    )
+                    futures.append((batch_number, filename, object_key, future))
                 
-                results.append({
-                    "filename": filename,
-                    "object_key": object_key,
-                    "url": url,
-                    "bucket": bucket,
-                    "profile": profile,
-                    "timestamp": timestamp,
-                    "batch_number": batch_number
-                })
+                for batch_number, filename, object_key, future in futures:
+                    future.result()
+                    
+                    url = f"{base_url}/{bucket}/{object_key}"
+                    
+                    results.append({
+                        "filename": filename,
+                        "object_key": object_key,
+                        "url": url,
+                        "bucket": bucket,
+                        "profile": profile,
+                        "timestamp": timestamp,
+                        "batch_number": batch_number
+                    })
             
-            return (json.dumps(results, indent=2),)
+            return (_dumps(results, indent=True),)
             
         except S3Error as e:
             raise ValueError(f"S3 Error: {e}")
@@ -277,6 +610,33 @@ class LoadImageFromS3:
     FUNCTION = "load_image"
     DESCRIPTION = "Load images from S3-compatible storage using config profiles"
 
+    @staticmethod
+    def _download_ranged(client, bucket, object_key, size, version_id=None):
+        """Download an object with parallel byte-range GETs into one preallocated buffer"""
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        
+        def fetch(offset):
+            length = min(RANGED_GET_CHUNK_SIZE, size - offset)
+            response = client.get_object(bucket, object_key, offset=offset, length=length, version_id=version_id)
+            try:
+                chunk = view[offset:offset + length]
+                received = 0
+                while received < length:
+                    n = response.readinto(chunk[received:])
+                    if not n:
+                        raise IOError(f"Incomplete range read at offset {offset + received} of {object_key}")
+                    received += n
+            finally:
+                response.close()
+                response.release_conn()
+        
+        offsets = range(0, size, RANGED_GET_CHUNK_SIZE)
+        with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(offsets))) as executor:
+            list(executor.map(fetch, offsets))
+        
+        return buffer
+
     def load_image(self, profile, bucket, object_key):
         """Load image from S3 storage"""
         
@@ -286,26 +646,43 @@ class LoadImageFromS3:
         try:
             client, profile_config = S3Client.create_from_profile(profile)
             
+            # Start the normal GET and only switch to ranged reads when its Content-Length
+            # shows a large object, so typical loads cost a single round trip
             response = client.get_object(bucket, object_key)
-            image_data = response.read()
-            response.close()
-            response.release_conn()
+            try:
+                size = int(response.headers.get("Content-Length") or 0)
+                version_id = response.headers.get("x-amz-version-id")
+                if size > RANGED_GET_THRESHOLD:
+                    img = None
+                else:
+                    # Decode directly from the response; load() forces the full decode
+                    # before the connection is handed back to the pool
+                    img = Image.open(response)
+                    img.load()
+            finally:
+                response.close()
+                response.release_conn()
             
-            img = Image.open(io.BytesIO(image_data))
+            if img is None:
+                image_data = self._download_ranged(client, bucket, object_key, size, version_id)
+                # BytesIO copies the bytearray, so peak memory here is about twice the object size
+                img = Image.open(io.BytesIO(image_data))
+                del image_data
+                img.load()
             img = ImageOps.exif_transpose(img)
             
             if img.mode == 'I':
                 img = img.point(lambda i: i * (1 / 255))
             
+            # Convert from uint8 with in-place torch ops to avoid float intermediates
             if 'A' in img.getbands():
-                mask = np.array(img.getchannel('A')).astype(np.float32) / 255.0
-                mask = 1. - torch.from_numpy(mask)
+                alpha = torch.from_numpy(np.array(img.getchannel('A')))
+                mask = alpha.to(torch.float32).mul_(-1.0 / 255.0).add_(1.0)
             else:
                 mask = torch.zeros((img.height, img.width), dtype=torch.float32)
             
             image = img.convert("RGB")
-            image = np.array(image).astype(np.float32) / 255.0
-            image = torch.from_numpy(image)[None,]
+            image = torch.from_numpy(np.array(image)).to(torch.float32).mul_(1.0 / 255.0)[None,]
             
             return (image, mask.unsqueeze(0))
             
@@ -328,7 +705,7 @@ class ListS3Objects:
             },
             "optional": {
                 "prefix": ("STRING", {"default": "", "tooltip": "Filter objects by prefix"}),
-                "max_objects": ("INT", {"default": 100, "min": 1, "max": 1000, "tooltip": "Maximum objects to return"}),
+                "max_objects": ("INT", {"default": 100, "min": 1, "max": 10000, "tooltip": "Maximum objects to return"}),
             }
         }
 
@@ -338,6 +715,50 @@ class ListS3Objects:
     FUNCTION = "list_objects"
     DESCRIPTION = "List objects in S3 bucket using config profiles"
 
+    @staticmethod
+    def _list_sharded(client, bucket, prefix, max_objects):
+        """List objects by fetching a few top-level sub-prefixes concurrently"""
+        def list_sequential():
+            return itertools.islice(
+                client.list_objects(bucket, prefix=prefix, recursive=True), max_objects
+            )
+        
+        # Only fan out when the whole top level fits in one page and has few sub-prefixes;
+        # otherwise sharding would list far more keys than the sequential path
+        top_level = list(itertools.islice(
+            client.list_objects(bucket, prefix=prefix, recursive=False), LIST_PAGE_SIZE + 1
+        ))
+        sub_prefixes = [entry.object_name for entry in top_level if entry.is_dir]
+        if len(top_level) > LIST_PAGE_SIZE or not sub_prefixes or len(sub_prefixes) > MAX_LIST_WORKERS:
+            return list_sequential()
+        
+        # Each sub-prefix covers a contiguous key range, so walking the sorted top level and
+        # expanding prefixes in place yields keys in order. Only the first page of every
+        # shard is fetched concurrently; a shard is paged further, sequentially, only while
+        # its keys are still needed, so at most one extra page per sub-prefix is wasted
+        top_level.sort(key=lambda entry: entry.object_name)
+        
+        def fetch_first_page(sub_prefix):
+            shard = client.list_objects(bucket, prefix=sub_prefix, recursive=True)
+            return list(itertools.islice(shard, LIST_PAGE_SIZE)), shard
+        
+        objects = []
+        with ThreadPoolExecutor(max_workers=len(sub_prefixes)) as executor:
+            first_pages = {name: executor.submit(fetch_first_page, name) for name in sub_prefixes}
+        
+        for entry in top_level:
+            if len(objects) >= max_objects:
+                break
+            if not entry.is_dir:
+                objects.append(entry)
+                continue
+            first_page, rest = first_pages[entry.object_name].result()
+            objects.extend(first_page)
+            if len(first_page) == LIST_PAGE_SIZE:
+                objects.extend(itertools.islice(rest, max(0, max_objects - len(objects))))
+        
+        return objects[:max_objects]
+
     def list_objects(self, profile, bucket, prefix="", max_objects=100):
         """List objects in S3 bucket"""
         
@@ -347,23 +768,24 @@ class ListS3Objects:
         try:
             client, profile_config = S3Client.create_from_profile(profile)
             
-            objects = client.list_objects(bucket, prefix=prefix, recursive=True)
+            if max_objects > LIST_PAGE_SIZE:
+                objects = self._list_sharded(client, bucket, prefix, max_objects)
+            else:
+                objects = itertools.islice(
+                    client.list_objects(bucket, prefix=prefix, recursive=True), max_objects
+                )
             
-            results = []
-            count = 0
-            for obj in objects:
-                if count >= max_objects:
-                    break
-                    
-                results.append({
+            results = [
+                {
                     "object_name": obj.object_name,
                     "size": obj.size,
-                    "last_modified": obj.last_modified.isoformat() if obj.last_modified else None,
+                    "last_modified": obj.last_modified,
                     "etag": obj.etag
-                })
-                count += 1
+                }
+                for obj in objects
+            ]
             
-            return (json.dumps(results, indent=2),)
+            return (_dumps(results, indent=True),)
             
         except S3Error as e:
             raise ValueError(f"S3 Error: {e}")
@@ -393,6 +815,9 @@ class S3ConfigInfo:
         
         config_path = S3ConfigManager.get_config_path()
         
+        if refresh:
+            S3ConfigManager.clear_cache()
+        
         info = {
             "config_file_path": str(config_path),
             "config_exists": config_path.exists(),
@@ -436,7 +861,7 @@ class S3ConfigInfo:
                 "Edit the generated file with your S3 credentials"
             ]
         
-        return (json.dumps(info, indent=2),)
+        return (_dumps(info, indent=True),)
 
 # Node registration
 NODE_CLASS_MAPPINGS = {